@@ -17,42 +17,49 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import settings
 from src.pipeline import WeatherPipeline
+from src.logging_config import setup_async_logging, stop_async_logging
 
 
 def setup_logging():
     """
-    Configure le système de logging.
+    Configure le système de logging (asynchrone, format JSON).
     
-    DEUX HANDLERS :
+    DEUX HANDLERS, exécutés dans un thread dédié :
     1. Console : pour voir en temps réel
     2. Fichier : pour garder l'historique
+    
+    Returns:
+        Le QueueListener à arrêter en fin d'exécution
     """
     # Créer le dossier logs si nécessaire
     log_dir = os.path.dirname(settings.LOG_FILE)
     if log_dir:
         os.makedirs(log_dir, exist_ok=True)
     
-    # Configuration du logging
-    logging.basicConfig(
+    # Le code métier écrit dans une file, le listener fait les I/O
+    listener = setup_async_logging(
         level=getattr(logging, settings.LOG_LEVEL),
-        format=settings.LOG_FORMAT,
         handlers=[
             # Handler console
             logging.StreamHandler(sys.stdout),
             # Handler fichier
             logging.FileHandler(settings.LOG_FILE, encoding="utf-8")
-        ]
+        ],
+        # Un message de succès sur N par ville (1 = tous)
+        sample_every=getattr(settings, "LOG_SAMPLE_EVERY", 1)
     )
     
     # Réduire le bruit des bibliothèques externes
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
+    
+    return listener
 
 
 def main():
     """Fonction principale."""
     # Configurer le logging en premier
-    setup_logging()
+    listener = setup_logging()
     
     logger = logging.getLogger(__name__)
     logger.info("Démarrage de l'application")
@@ -74,8 +81,12 @@ def main():
             return 1  # Code de sortie : échec
             
     except Exception as e:
-        logger.critical(f"Erreur critique : {e}")
+        logger.critical("Erreur critique : %s", e)
         return 1
+    
+    finally:
+        # Vider la file de logs avant de quitter
+        stop_async_logging(listener)
 
 
 # Point d'entrée standard Python
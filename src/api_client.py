@@ -85,7 +85,11 @@ class WeatherAPIClient:
         # Tentatives avec retry
         for attempt in range(1, settings.MAX_RETRIES + 1):
             try:
-                logger.debug(f"Tentative {attempt}/{settings.MAX_RETRIES} pour {city}")
+                logger.debug(
+                    "Tentative %d/%d pour %s",
+                    attempt, settings.MAX_RETRIES, city,
+                    extra={"city": city, "attempt": attempt}
+                )
                 
                 # Effectuer la requête avec timeout
                 response = self.session.get(
@@ -99,13 +103,19 @@ class WeatherAPIClient:
                 response.raise_for_status()
                 
                 # Succès ! On retourne les données JSON
-                logger.info(f"Météo récupérée pour {city}")
+                # Message de succès : échantillonné par ville (voir logging_config)
+                logger.info(
+                    "Météo récupérée pour %s", city,
+                    extra={"city": city, "attempt": attempt, "sampled": True}
+                )
                 return response.json()
                 
             except requests.exceptions.Timeout:
                 # L'API n'a pas répondu à temps
                 logger.warning(
-                    f"Timeout pour {city} (tentative {attempt}/{settings.MAX_RETRIES})"
+                    "Timeout pour %s (tentative %d/%d)",
+                    city, attempt, settings.MAX_RETRIES,
+                    extra={"city": city, "attempt": attempt}
                 )
                 
             except requests.exceptions.HTTPError as e:
@@ -119,29 +129,45 @@ class WeatherAPIClient:
                     
                 elif status_code == 404:
                     # Ville non trouvée - pas la peine de réessayer
-                    logger.warning(f"Ville non trouvée : {city}")
+                    logger.warning(
+                        "Ville non trouvée : %s", city,
+                        extra={"city": city, "status_code": status_code}
+                    )
                     return None
                     
                 elif status_code == 429:
                     # Rate limit - on attend plus longtemps
-                    logger.warning(f"Rate limit atteint, attente prolongée...")
+                    logger.warning(
+                        "Rate limit atteint, attente prolongée...",
+                        extra={"city": city, "status_code": status_code}
+                    )
                     time.sleep(settings.RETRY_DELAY * 5)
                     
                 else:
-                    logger.warning(f"Erreur HTTP {status_code} pour {city}")
+                    logger.warning(
+                        "Erreur HTTP %d pour %s", status_code, city,
+                        extra={"city": city, "status_code": status_code}
+                    )
                     
             except requests.exceptions.RequestException as e:
                 # Autres erreurs réseau
-                logger.warning(f"Erreur réseau pour {city}: {e}")
+                logger.warning(
+                    "Erreur réseau pour %s: %s", city, e,
+                    extra={"city": city, "attempt": attempt}
+                )
             
             # Attendre avant de réessayer (backoff exponentiel)
             if attempt < settings.MAX_RETRIES:
                 wait_time = settings.RETRY_DELAY * (2 ** (attempt - 1))
-                logger.debug(f"Attente de {wait_time}s avant nouvelle tentative")
+                logger.debug("Attente de %ss avant nouvelle tentative", wait_time)
                 time.sleep(wait_time)
         
         # Toutes les tentatives ont échoué
-        logger.error(f"Échec définitif pour {city} après {settings.MAX_RETRIES} tentatives")
+        logger.error(
+            "Échec définitif pour %s après %d tentatives",
+            city, settings.MAX_RETRIES,
+            extra={"city": city}
+        )
         return None
     
     def close(self):
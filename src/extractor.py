@@ -54,7 +54,7 @@ class WeatherExtractor:
         successful = 0
         failed = 0
         
-        logger.info(f"Début extraction pour {len(cities)} villes")
+        logger.info("Début extraction pour %d villes", len(cities))
         
         for city in cities:
             # Récupérer les données de la ville
@@ -72,7 +72,9 @@ class WeatherExtractor:
         
         # Résumé de l'extraction
         logger.info(
-            f"Extraction terminée : {successful} succès, {failed} échecs"
+            "Extraction terminée : %d succès, %d échecs",
+            successful, failed,
+            extra={"successful": successful, "failed": failed}
         )
         
         return results
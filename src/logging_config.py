@@ -0,0 +1,153 @@
+"""
+Configuration du logging asynchrone et structuré.
+
+Ce module gère :
+- L'envoi des logs vers une file (queue) au lieu d'écrire directement
+- L'écriture réelle (console, fichier) dans un thread en arrière-plan
+- Le format JSON (une ligne par événement)
+- L'échantillonnage des messages de succès par ville
+
+POURQUOI ?
+Avec beaucoup de requêtes, écrire chaque log sur disque dans le
+thread principal ralentit le pipeline. Ici, le code métier se contente
+de déposer l'enregistrement dans une file : le formatage et les I/O
+se font ailleurs.
+"""
+
+import json
+import queue
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+# Attributs standards d'un LogRecord : tout le reste vient de `extra=`
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formate chaque enregistrement en une ligne JSON.
+
+    Les champs passés via `extra={...}` (ex: city, attempt)
+    sont ajoutés tels quels à l'objet JSON.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Convertit un LogRecord en chaîne JSON."""
+        payload = {
+            "time": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        # Champs structurés ajoutés par le code appelant
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class CitySamplingFilter(logging.Filter):
+    """
+    Échantillonne les messages de succès, ville par ville.
+
+    Seuls les enregistrements marqués `extra={"sampled": True, "city": ...}`
+    sont concernés : on garde le 1er, puis un sur `every`.
+    Le message conservé porte le nombre de messages omis (`suppressed`).
+    Les avertissements et erreurs ne sont jamais filtrés.
+    """
+
+    def __init__(self, every: int = 1):
+        """
+        Args:
+            every: Garder un message de succès sur `every` par ville.
+                   1 = tout garder.
+        """
+        super().__init__()
+        self.every = max(1, every)
+        self._counts: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Retourne False si le message doit être ignoré."""
+        if not getattr(record, "sampled", False):
+            return True
+
+        city = getattr(record, "city", None)
+        count = self._counts.get(city, 0)
+        self._counts[city] = count + 1
+
+        if count % self.every:
+            return False
+
+        record.suppressed = self.every - 1 if count else 0
+        return True
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler qui ne formate pas le message avant l'envoi.
+
+    Par défaut, QueueHandler.prepare() appelle format() dans le thread
+    appelant. Ici on laisse le formatage au thread d'écriture.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_async_logging(
+    level: int,
+    handlers: List[logging.Handler],
+    sample_every: int = 1,
+) -> logging.handlers.QueueListener:
+    """
+    Installe le logging asynchrone sur le logger racine.
+
+    Args:
+        level: Niveau minimal (ex: logging.INFO)
+        handlers: Handlers réels (console, fichier...), exécutés
+                  dans le thread du QueueListener
+        sample_every: Voir CitySamplingFilter
+
+    Returns:
+        Le QueueListener démarré. Appeler stop() en fin de programme
+        pour vider la file.
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+
+    formatter = JsonFormatter()
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Le filtre s'applique avant la mise en file : les messages
+    # écartés ne coûtent ni formatage ni I/O
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(CitySamplingFilter(sample_every))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
+def stop_async_logging(listener: Optional[logging.handlers.QueueListener]):
+    """Arrête le thread d'écriture après avoir vidé la file."""
+    if listener is not None:
+        listener.stop()
@@ -77,15 +77,15 @@ class WeatherPipeline:
             
             logger.info("=" * 60)
             logger.info("PIPELINE TERMINÉ AVEC SUCCÈS")
-            logger.info(f"  - Villes traitées : {len(df)}")
-            logger.info(f"  - Fichier généré  : {output_path}")
-            logger.info(f"  - Durée : {duration:.2f} secondes")
+            logger.info("  - Villes traitées : %d", len(df))
+            logger.info("  - Fichier généré  : %s", output_path)
+            logger.info("  - Durée : %.2f secondes", duration)
             logger.info("=" * 60)
             
             return df
             
         except Exception as e:
-            logger.error(f"Erreur fatale du pipeline : {e}")
+            logger.error("Erreur fatale du pipeline : %s", e)
             raise
         
         finally:
@@ -111,7 +111,7 @@ class WeatherPipeline:
         # Sauvegarder en CSV
         df.to_csv(output_path, index=False, encoding="utf-8")
         
-        logger.info(f"Résultats sauvegardés : {output_path}")
+        logger.info("Résultats sauvegardés : %s", output_path)
         return output_path
     
     def _cleanup(self):
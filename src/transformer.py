@@ -96,12 +96,13 @@ class WeatherTransformer:
                 timestamp=datetime.fromtimestamp(raw_data.get("dt", 0))
             )
             
-            logger.debug(f"Parsing réussi pour {record.city}")
+            # Formatage paresseux : rien n'est construit si DEBUG est désactivé
+            logger.debug("Parsing réussi pour %s", record.city)
             return record
             
         except (KeyError, IndexError, TypeError) as e:
             # Erreur de structure des données
-            logger.error(f"Erreur de parsing : {e}")
+            logger.error("Erreur de parsing : %s", e)
             return None
     
     def transform(self, raw_data_list: List[Dict[str, Any]]) -> pd.DataFrame:
@@ -135,7 +136,7 @@ class WeatherTransformer:
         # Nettoyage et enrichissement
         df = self._clean_dataframe(df)
         
-        logger.info(f"Transformation terminée : {len(df)} lignes")
+        logger.info("Transformation terminée : %d lignes", len(df))
         return df
     
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
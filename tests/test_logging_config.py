@@ -0,0 +1,55 @@
+import json
+import logging
+
+from src.logging_config import CitySamplingFilter, JsonFormatter
+
+
+def _make_record(msg, *args, **extra):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class TestJsonFormatter:
+    """Tests pour le formateur JSON."""
+    
+    def test_format_includes_extra_fields(self):
+        """Les champs `extra` apparaissent dans la ligne JSON."""
+        # ARRANGE
+        record = _make_record("Météo récupérée pour %s", "Paris", city="Paris")
+        
+        # ACT
+        payload = json.loads(JsonFormatter().format(record))
+        
+        # ASSERT
+        assert payload["message"] == "Météo récupérée pour Paris"
+        assert payload["city"] == "Paris"
+        assert payload["level"] == "INFO"
+
+
+class TestCitySamplingFilter:
+    """Tests pour l'échantillonnage par ville."""
+    
+    def test_keeps_one_success_out_of_n_per_city(self):
+        """Un message de succès sur N est conservé, ville par ville."""
+        # ARRANGE
+        sampler = CitySamplingFilter(every=3)
+        
+        # ACT
+        kept = [
+            sampler.filter(_make_record("ok", city=city, sampled=True))
+            for city in ["Paris"] * 4 + ["Lyon"]
+        ]
+        
+        # ASSERT
+        assert kept == [True, False, False, True, True]
+    
+    def test_unsampled_records_always_pass(self):
+        """Les messages non marqués (erreurs...) ne sont jamais filtrés."""
+        # ARRANGE
+        sampler = CitySamplingFilter(every=100)
+        
+        # ACT / ASSERT
+        for _ in range(3):
+            assert sampler.filter(_make_record("erreur", city="Paris"))